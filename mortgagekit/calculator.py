@@ -7,6 +7,7 @@ See README for more details.
 from __future__ import print_function
 import sys
 import argparse
+import bisect
 from datetime import datetime, timedelta
 from decimal import Decimal
 import math
@@ -64,6 +65,7 @@ class MortgageCalculator(object):
         self._payment_frequency = payment_frequency
         self._compounding_period = compounding_period
         self._first_payment_date = first_payment_date_obj
+        self._payment_date_index = None
 
     def get_payment_frequency(self):
         return self._payment_frequency
@@ -178,6 +180,84 @@ class MortgageCalculator(object):
 
         return payment_schedule
 
+    def get_payoff_quote(self, as_of_date):
+        """
+        Function will return the payoff quote for the loan as of the
+        "as_of_date" parameter without building the payment schedule. The
+        quote includes the loan balance after the last payment made on or
+        before the date plus the per diem interest accrued since then.
+        """
+        as_of_date = get_date_from_value(as_of_date)
+        payment_dates, interest_rate_per_payment, mortgage_payment = self._get_payment_date_index()
+        first_payment_date = get_date_from_value(self._first_payment_date)
+        total_payments = int(self.get_total_number_of_payments_per_frequency())
+
+        # Find the number of payments made on or before the date.
+        if payment_dates is None:
+            # Week based calendars are regular so simple arithmetic will do.
+            days_per_payment = 364 // int(self._payment_frequency)
+            days_since_first_payment = max((as_of_date - first_payment_date).days, 0)
+            payments_made = min(days_since_first_payment // days_per_payment, total_payments)
+            last_payment_date = first_payment_date + timedelta(days=payments_made*days_per_payment)
+            next_payment_date = last_payment_date + timedelta(days=days_per_payment)
+        else:
+            payments_made = max(bisect.bisect_right(payment_dates, as_of_date) - 1, 0)
+            last_payment_date = payment_dates[payments_made]
+            next_payment_date = payment_dates[min(payments_made+1, total_payments)]
+        if payments_made == total_payments:
+            next_payment_date = None
+
+        # Calculate the remaining loan balance after the payments made.
+        loan_balance = get_loan_balance_after_payments(
+            loan_amount = self._loan_amount,
+            mortgage_payment = mortgage_payment,
+            interest_rate_per_payment = interest_rate_per_payment,
+            payments_made = payments_made
+        )
+
+        # Calculate the interest accrued since the last payment.
+        days_accrued = max((as_of_date - last_payment_date).days, 0)
+        per_diem = loan_balance * (self._annual_interest_rate / MORTGAGEKIT_DAYS_PER_YEAR)
+        accrued_interest = per_diem * days_accrued
+
+        return {
+            'as_of_date': as_of_date,
+            'payments_made': payments_made,
+            'last_payment_date': last_payment_date,
+            'next_payment_date': next_payment_date,
+            'loan_balance': loan_balance,
+            'per_diem': per_diem,
+            'days_accrued': days_accrued,
+            'accrued_interest': accrued_interest,
+            'payoff_amount': loan_balance + accrued_interest
+        }
+
+    def _get_payment_date_index(self):
+        """
+        Function will return the payment dates used by the payment schedule,
+        starting with the first payment date, along with the interest rate
+        and payment per frequency. The results are computed once and reused
+        by every payoff quote for this calculator.
+
+        Week based frequencies return no payment dates because they can be
+        computed with arithmetic; month based frequencies need the list since
+        "relativedelta" clamps the day of the month and the dates drift.
+        """
+        if self._payment_date_index is None:
+            payment_dates = None
+            if self._payment_frequency is not MORTGAGEKIT_WEEK and self._payment_frequency is not MORTGAGEKIT_BI_WEEK:
+                current_payment_date = get_date_from_value(self._first_payment_date)
+                payment_dates = [current_payment_date]
+                for payment in range(int(self.get_total_number_of_payments_per_frequency())):
+                    current_payment_date = get_next_date_by_frequency(current_payment_date, self._payment_frequency)
+                    payment_dates.append(current_payment_date)
+            self._payment_date_index = (
+                payment_dates,
+                Decimal(self.get_interest_rate_per_payment_frequency()),
+                self.get_mortgage_payment_per_payment_frequency()
+            )
+        return self._payment_date_index
+
     def get_monthly_mortgage_payment(self):
         """
         Function will return the amount paid per payment standardized to
@@ -197,3 +277,12 @@ class MortgageCalculator(object):
             mortgage_payment = self.get_mortgage_payment_per_payment_frequency(),
             frequency = self._payment_frequency
         )
+
+
+def get_payoff_quotes(queries):
+    """
+    Function will return the payoff quotes for every (calculator, date) pair
+    in the "queries" parameter, in the same order. This is a convenience
+    wrapper around "get_payoff_quote" and does no extra work sharing.
+    """
+    return [calc.get_payoff_quote(as_of_date) for calc, as_of_date in queries]
@@ -9,3 +9,7 @@ MORTGAGEKIT_BI_MONTH = Decimal(6)
 MORTGAGEKIT_MONTH = Decimal(12)
 MORTGAGEKIT_BI_WEEK = Decimal(26)
 MORTGAGEKIT_WEEK = Decimal(52)
+
+
+# Day count used when accruing per diem interest between payment dates.
+MORTGAGEKIT_DAYS_PER_YEAR = Decimal(365)
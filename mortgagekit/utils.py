@@ -2,7 +2,7 @@
 from __future__ import print_function
 import sys
 import argparse
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 import math
 from dateutil.relativedelta import relativedelta
@@ -107,3 +107,40 @@ def get_next_date_by_frequency(current_payment_date, frequency):
     else:
         raise Exception("ERROR: Unsupported payment frequency type!")
     return current_payment_date
+
+
+def get_date_from_value(value):
+    """
+    Function will return a "date" object from the "value" parameter which
+    may be a "date", "datetime" or "YYYY-MM-DD" formatted string.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    elif isinstance(value, date):
+        return value
+    elif isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    else:
+        raise Exception("ERROR: Unsupported date type!")
+
+
+def get_loan_balance_after_payments(loan_amount, mortgage_payment, interest_rate_per_payment, payments_made):
+    """
+    Function will return the remaining loan balance after the number of
+    payments in the "payments_made" parameter using the closed form of the
+    amortization formula instead of iterating over every payment.
+    """
+    assert isinstance(loan_amount, Money), 'loan_amount is not a Money class: %r' % loan_amount
+    assert isinstance(mortgage_payment, Money), 'mortgage_payment is not a Money class: %r' % mortgage_payment
+    assert isinstance(interest_rate_per_payment, Decimal), 'interest_rate_per_payment is not a Decimal class: %r' % interest_rate_per_payment
+
+    if interest_rate_per_payment == 0:
+        loan_balance = loan_amount - mortgage_payment * payments_made
+    else:
+        growth = (interest_rate_per_payment + 1) ** payments_made
+        loan_balance = loan_amount * growth - mortgage_payment * ((growth - 1) / interest_rate_per_payment)
+
+    # Defensive Code: Rounding can leave a tiny negative balance at maturity.
+    if loan_balance.amount < 0:
+        return Money(amount=0, currency=loan_amount.currency)
+    return loan_balance
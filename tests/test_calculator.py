@@ -138,6 +138,88 @@ class TestMortgageCalculator(unittest.TestCase):
         expected = Money(amount=12624.48, currency='USD')
         self.assertAlmostEqual(annual_mortgage_payment.amount,  expected.amount, 2)
 
+    def test_get_payoff_quote(self):
+        payment_schedule = self.calc.get_mortgage_payment_schedule()
+
+        # Case 1 - Before the first payment the full loan is owed.
+        payoff_quote = self.calc.get_payoff_quote('2008-01-01')
+        self.assertEqual(payoff_quote['payments_made'], 0)
+        self.assertEqual(payoff_quote['days_accrued'], 0)
+        self.assertAlmostEqual(payoff_quote['payoff_amount'].amount, Money(amount=200000.00, currency='USD').amount, 2)
+
+        # Case 2 - On a payment date the balance matches the schedule.
+        interval_01_05 = payment_schedule[4]
+        payoff_quote = self.calc.get_payoff_quote(interval_01_05['paymentData'])
+        self.assertEqual(payoff_quote['payments_made'], 5)
+        self.assertEqual(payoff_quote['days_accrued'], 0)
+        self.assertAlmostEqual(payoff_quote['loan_balance'].amount, interval_01_05['loan_balance'].amount, 2)
+
+        # Case 3 - Between payment dates per diem interest is accrued.
+        payoff_quote = self.calc.get_payoff_quote(datetime(2008, 6, 11))
+        self.assertEqual(payoff_quote['payments_made'], 5)
+        self.assertEqual(payoff_quote['days_accrued'], 10)
+        self.assertEqual(payoff_quote['next_payment_date'], payment_schedule[5]['paymentData'])
+        self.assertAlmostEqual(payoff_quote['per_diem'].amount, Money(amount=21.70, currency='USD').amount, 2)
+        self.assertAlmostEqual(payoff_quote['payoff_amount'].amount, Money(amount=198249.75, currency='USD').amount, 2)
+
+        # Case 4 - After the last payment nothing is owed.
+        payoff_quote = self.calc.get_payoff_quote('2040-01-01')
+        self.assertEqual(payoff_quote['payments_made'], 300)
+        self.assertIsNone(payoff_quote['next_payment_date'])
+        self.assertAlmostEqual(payoff_quote['payoff_amount'].amount, Money(amount=0.00, currency='USD').amount, 2)
+        self.assertGreaterEqual(payoff_quote['loan_balance'].amount, 0)
+        self.assertGreaterEqual(payoff_quote['payoff_amount'].amount, 0)
+
+    def test_get_payoff_quote_by_week(self):
+        calc = MortgageCalculator(
+            total_amount=Money(amount=250000.00, currency="USD"),
+            down_payment_amount=Money(amount=50000.00, currency="USD"),
+            amortization_year=25,
+            annual_interest_rate=Decimal(0.04),
+            payment_frequency=MORTGAGEKIT_WEEK,
+            compounding_period=MORTGAGEKIT_SEMI_ANNUAL,
+            first_payment_date='2008-01-31'
+        )
+
+        # Week based quotes use arithmetic instead of a payment date index.
+        payoff_quote = calc.get_payoff_quote('2008-02-16')
+        payment_dates, interest_rate_per_payment, mortgage_payment = calc._payment_date_index
+        self.assertIsNone(payment_dates)
+        self.assertEqual(payoff_quote['payments_made'], 2)
+        self.assertEqual(payoff_quote['last_payment_date'], datetime(2008, 2, 14).date())
+        self.assertEqual(payoff_quote['next_payment_date'], datetime(2008, 2, 21).date())
+        self.assertEqual(payoff_quote['days_accrued'], 2)
+
+        # The dates and balances still match the payment schedule.
+        payment_schedule = calc.get_mortgage_payment_schedule()
+        for interval in (payment_schedule[0], payment_schedule[99], payment_schedule[1299]):
+            payoff_quote = calc.get_payoff_quote(interval['paymentData'])
+            self.assertEqual(payoff_quote['last_payment_date'], interval['paymentData'])
+            self.assertAlmostEqual(payoff_quote['loan_balance'].amount, interval['loan_balance'].amount, 2)
+        self.assertIsNone(payoff_quote['next_payment_date'])
+
+    def test_get_payoff_quotes(self):
+        calc = MortgageCalculator(
+            total_amount=Money(amount=250000.00, currency="USD"),
+            down_payment_amount=Money(amount=50000.00, currency="USD"),
+            amortization_year=25,
+            annual_interest_rate=Decimal(0.04),
+            payment_frequency=MORTGAGEKIT_BI_WEEK,
+            compounding_period=MORTGAGEKIT_SEMI_ANNUAL,
+            first_payment_date='2008-01-01'
+        )
+        payment_schedule = calc.get_mortgage_payment_schedule()
+        payoff_quotes = get_payoff_quotes([
+            (self.calc, '2008-06-11'),
+            (calc, payment_schedule[9]['paymentData']),
+            (calc, '2007-01-01'),
+        ])
+        self.assertEqual(len(payoff_quotes), 3)
+        self.assertEqual(payoff_quotes[0]['payments_made'], 5)
+        self.assertEqual(payoff_quotes[1]['payments_made'], 10)
+        self.assertAlmostEqual(payoff_quotes[1]['loan_balance'].amount, payment_schedule[9]['loan_balance'].amount, 2)
+        self.assertEqual(payoff_quotes[2]['payments_made'], 0)
+
 if __name__ == '__main__':
     unittest.main()
 
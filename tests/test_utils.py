@@ -144,3 +144,33 @@ class TestUtils(unittest.TestCase):
             get_next_date_by_frequency(test_datetime, Decimal(666.00))
         except Exception as e:
             self.assertIn("ERROR: Unsupported payment frequency type!", str(e))
+
+    def test_get_date_from_value(self):
+        expected = datetime(2008, 1, 1).date()
+        self.assertEqual(get_date_from_value('2008-01-01'), expected)
+        self.assertEqual(get_date_from_value(datetime(2008, 1, 1)), expected)
+        self.assertEqual(get_date_from_value(expected), expected)
+
+        # Exception.
+        try:
+            get_date_from_value(1234)
+        except Exception as e:
+            self.assertIn("ERROR: Unsupported date type!", str(e))
+
+    def test_get_loan_balance_after_payments(self):
+        loan_amount = Money(amount=200000.00, currency="USD")
+        mortgage_payment = Money(amount=1000.00, currency="USD")
+
+        # No interest.
+        actual = get_loan_balance_after_payments(loan_amount, mortgage_payment, Decimal(0), 10)
+        expected = Money(amount=190000.00, currency="USD")
+        self.assertAlmostEqual(actual.amount, expected.amount, 2)
+
+        # With interest.
+        actual = get_loan_balance_after_payments(loan_amount, mortgage_payment, Decimal('0.01'), 2)
+        expected = Money(amount=202010.00, currency="USD")
+        self.assertAlmostEqual(actual.amount, expected.amount, 2)
+
+        # Paid off.
+        actual = get_loan_balance_after_payments(loan_amount, Money(amount=1000.01, currency="USD"), Decimal(0), 200)
+        self.assertEqual(actual.amount, Money(amount=0, currency="USD").amount)